@@ -2,9 +2,15 @@
 CloudConnect - Base Resource and Logger Classes
 """
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections import deque
 from enum import Enum
+from itertools import islice
+import atexit
 import os
+import queue
+import sys
+import threading
+import time
 
 
 class ResourceState(Enum):
@@ -16,53 +22,227 @@ class ResourceState(Enum):
 
 
 class ResourceLogger:
-    """Handles logging for resource operations"""
+    """Handles logging for resource operations
     
-    def __init__(self, log_dir="logs"):
+    One logger is shared per log directory, so every resource writes through
+    the same file handles, writer thread and recent-entries buffer. Passing
+    console=False (e.g. from the GUI) stops entries being echoed to stdout for
+    every user of that logger; console=None leaves the current setting alone.
+    """
+    
+    BUFFER_SIZE = 8192      # Bytes held in memory before a write is issued
+    FLUSH_INTERVAL = 1.0    # Seconds before buffered entries are forced to disk
+    MAX_BATCH = 256         # Entries drained from the queue per write pass
+    RECENT_LIMIT = 20       # Entries kept in memory for get_all_logs
+    TAIL_BYTES = 8192       # Bytes read from the end of each log file when seeding
+    
+    _instances = {}  # Shared logger per log directory
+    
+    def __new__(cls, log_dir="logs", console=None):
+        instance = cls._instances.get(log_dir)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._initialized = False
+            cls._instances[log_dir] = instance
+        return instance
+    
+    def __init__(self, log_dir="logs", console=None):
+        if console is not None:
+            self.console_enabled = console
+        if self._initialized:
+            return
+        self._initialized = True
+        
         self.log_dir = log_dir
         os.makedirs(log_dir, exist_ok=True)
+        if console is None:
+            self.console_enabled = True
+        
+        self._handles = {}  # Open log files keyed by path
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._writer = None
+        self._write_failed = False  # Set once a file write error has been reported
+        self._recent = deque(self._read_log_files(), maxlen=self.RECENT_LIMIT)
+        self._timestamp = (-1, "")  # (minute since epoch, formatted time) of last entry
+        atexit.register(self._close_all)
     
     def log(self, resource_type, resource_name, action, details=""):
         """Log a resource operation to both console and file"""
-        timestamp = datetime.now().strftime("%I:%M %p")
+        timestamp = self._format_timestamp()
         log_message = f"[{timestamp}] {resource_type} '{resource_name}' {action}"
         
         if details:
             log_message += f" {details}"
         
-        # Console output
-        print(log_message)
+        # Console output stays on the caller so it interleaves correctly with CLI output
+        if self.console_enabled:
+            print(log_message)
+        self._recent.append(log_message + "\n")
         
-        # File output
+        # File output is handed off to the writer thread
         log_file = os.path.join(self.log_dir, f"{resource_type.lower()}.log")
-        with open(log_file, 'a') as f:
-            f.write(log_message + "\n")
+        self._start_writer()
+        self._queue.put((log_file, log_message + "\n"))
         
         return log_message
     
+    def _format_timestamp(self):
+        """Return the current time as shown in log entries, formatted once per minute"""
+        now = time.time()
+        minute = int(now // 60)
+        if minute != self._timestamp[0]:
+            self._timestamp = (minute, time.strftime("%I:%M %p", time.localtime(now)))
+        return self._timestamp[1]
+    
+    def _start_writer(self):
+        """Start the daemon thread that performs all log file writes"""
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer.start()
+    
+    def _writer_loop(self):
+        """Drain queued entries, writing each file's batch in a single call"""
+        last_flush = time.monotonic()
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self.FLUSH_INTERVAL)]
+            except queue.Empty:
+                self._flush_all()
+                last_flush = time.monotonic()
+                continue
+            
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stopping = self._write_batch(batch)
+            if stopping or time.monotonic() - last_flush >= self.FLUSH_INTERVAL:
+                self._flush_all()
+                last_flush = time.monotonic()
+            
+            for _ in batch:
+                self._queue.task_done()
+            if stopping:
+                return
+    
+    def _write_batch(self, batch):
+        """Write a batch of queued entries; return True if it holds the stop sentinel"""
+        stopping = False
+        grouped = {}
+        for entry in batch:
+            if entry is None:
+                stopping = True
+            else:
+                log_file, line = entry
+                grouped.setdefault(log_file, []).append(line)
+        
+        with self._lock:
+            for log_file, lines in grouped.items():
+                try:
+                    self._get_handle(log_file).write("".join(lines))
+                except (OSError, ValueError) as e:
+                    self._report_write_error(e)
+        return stopping
+    
+    def _get_handle(self, log_file):
+        """Return the cached append handle for a log file"""
+        f = self._handles.get(log_file)
+        if f is None:
+            f = open(log_file, 'a', buffering=self.BUFFER_SIZE,
+                     encoding='utf-8', errors='backslashreplace')
+            self._handles[log_file] = f
+        return f
+    
+    def _flush_all(self):
+        """Flush every open log file"""
+        with self._lock:
+            for f in self._handles.values():
+                try:
+                    f.flush()
+                except (OSError, ValueError) as e:
+                    self._report_write_error(e)
+    
+    def _report_write_error(self, error):
+        """Report the first failed log file write on stderr; entries are dropped"""
+        if not self._write_failed:
+            self._write_failed = True
+            print(f"Warning: could not write log file: {error}", file=sys.stderr)
+    
+    def _close_all(self):
+        """Stop the writer thread, then flush and close every open log file"""
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+        
+        with self._lock:
+            for f in self._handles.values():
+                try:
+                    f.close()
+                except (OSError, ValueError) as e:
+                    self._report_write_error(e)
+            self._handles.clear()
+    
     def get_all_logs(self):
-        """Retrieve all logs from the log directory"""
+        """Retrieve the most recent log entries"""
+        return list(self._recent)
+    
+    def _read_log_files(self):
+        """Read the latest entries from the tail of each log file on disk"""
         all_logs = []
         if not os.path.exists(self.log_dir):
             return all_logs
         
-        for filename in os.listdir(self.log_dir):
-            if filename.endswith('.log'):
-                filepath = os.path.join(self.log_dir, filename)
-                with open(filepath, 'r') as f:
-                    all_logs.extend(f.readlines())
+        with os.scandir(self.log_dir) as entries:
+            for entry in entries:
+                if not (entry.name.endswith('.log') and entry.is_file()):
+                    continue
+                with open(entry.path, 'rb') as f:
+                    start = max(0, f.seek(0, os.SEEK_END) - self.TAIL_BYTES)
+                    f.seek(start)
+                    lines = f.read().decode(errors='replace').splitlines(True)
+                
+                # A read starting mid-file begins with a partial line
+                if start > 0:
+                    lines = lines[1:]
+                all_logs.extend(lines[-self.RECENT_LIMIT:])
         
-        return sorted(all_logs)[-20:]  # Return last 20 entries
+        return sorted(all_logs)[-self.RECENT_LIMIT:]
 
 
 class Resource(ABC):
-    """Abstract base class for all cloud resources"""
+    """Abstract base class for all cloud resources
+    
+    Subclasses pass their configuration as an immutable NamedTuple and
+    declare empty __slots__ so instances stay free of a __dict__. A plain
+    dict config is still accepted.
+    """
     
-    def __init__(self, name, config):
+    __slots__ = ('name', 'config', 'state', 'logger', '_state_str', '_state_listener',
+                 '_display_prefix', '_start_details', '_config_summary')
+    
+    TYPE_ID = None  # Assigned by ResourceRegistry.register
+    
+    def __init_subclass__(cls, **kwargs):
+        """Precompute the shared success results of the lifecycle operations"""
+        super().__init_subclass__(**kwargs)
+        cls._OK_STARTED = (True, f"{cls.__name__} started successfully")
+        cls._OK_STOPPED = (True, f"{cls.__name__} stopped successfully")
+        cls._OK_DELETED = (True, f"{cls.__name__} marked as deleted")
+    
+    def __init__(self, name, config, logger=None):
         self.name = name
         self.config = config
         self.state = ResourceState.CREATED
-        self.logger = ResourceLogger()
+        self._state_str = self.state.value  # Kept in step with state by _set_state
+        self._state_listener = None  # Called with the resource after each state change
+        self.logger = logger or ResourceLogger()
+        self._display_prefix = None  # Immutable part of get_display_info, set by subclasses
+        self._config_summary = None
+        self._start_details = None  # Formatted on first start; config is immutable
         self._log_action("created", self._format_creation_details())
     
     @abstractmethod
@@ -83,10 +263,11 @@ class Resource(ABC):
         if self.state == ResourceState.STARTED:
             return False, "Resource is already running"
         
-        self.state = ResourceState.STARTED
-        details = self._format_start_details()
-        self._log_action("started", details)
-        return True, f"{self.__class__.__name__} started successfully"
+        if self._start_details is None:
+            self._start_details = self._format_start_details()
+        self._set_state(ResourceState.STARTED)
+        self._log_action("started", self._start_details)
+        return self._OK_STARTED
     
     def stop(self):
         """Stop the resource"""
@@ -96,9 +277,9 @@ class Resource(ABC):
         if self.state != ResourceState.STARTED:
             return False, "Resource is not running"
         
-        self.state = ResourceState.STOPPED
+        self._set_state(ResourceState.STOPPED)
         self._log_action("stopped")
-        return True, f"{self.__class__.__name__} stopped successfully"
+        return self._OK_STOPPED
     
     def delete(self):
         """Soft delete the resource"""
@@ -108,9 +289,24 @@ class Resource(ABC):
         if self.state == ResourceState.STARTED:
             return False, "Cannot delete: Resource must be stopped first"
         
-        self.state = ResourceState.DELETED
+        self._set_state(ResourceState.DELETED)
         self._log_action("marked as deleted")
-        return True, f"{self.__class__.__name__} marked as deleted"
+        return self._OK_DELETED
+    
+    def get_config_summary(self):
+        """Return a short summary of the first two configuration values"""
+        if self._config_summary is None:
+            config = self.config
+            items = config.items() if hasattr(config, 'items') else zip(config._fields, config)
+            self._config_summary = ", ".join([f"{k}: {v}" for k, v in islice(items, 2)])
+        return self._config_summary
+    
+    def _set_state(self, state):
+        """Move to a new lifecycle state and notify the owning manager, if any"""
+        self.state = state
+        self._state_str = state.value
+        if self._state_listener is not None:
+            self._state_listener(self)
     
     def _log_action(self, action, details=""):
         """Internal method to log actions"""
@@ -1,10 +1,48 @@
 """
 CloudConnect - Command Line Interface
 """
-import random
-import string
+import io
+import secrets
+import sys
 from registry import CloudConnectManager, ResourceRegistry
-from base_resources import ResourceLogger
+
+# Configuration choices offered for each resource type
+_RUNTIMES = ("python", "nodejs", "dotnet")
+_REGIONS = ("EastUS", "WestEurope", "CentralIndia")
+_REPLICAS = (1, 2, 3)
+_SIZES = (50, 100, 500, 1000)
+_TTLS = (60, 300, 600, 3600)
+_TTL_LABELS = ("60s (1 min)", "300s (5 min)", "600s (10 min)", "3600s (1 hour)")
+_CAPACITIES = (128, 256, 512, 1024)
+_POLICIES = ("LRU", "FIFO", "LFU", "RANDOM")
+
+_INPUT_BUFFER_SIZE = 8192
+_ACCESS_KEY_BYTES = 24  # Encodes to exactly 32 URL-safe characters
+
+_SEP = "=" * 50
+_DIVIDER = "-" * 50
+_MENU = "\n".join([
+    "\n" + _SEP,
+    "CloudConnect - Cloud Resource Manager",
+    _SEP,
+    "1. Create Resource",
+    "2. Start Resource",
+    "3. Stop Resource",
+    "4. Delete Resource",
+    "5. View Logs",
+    "6. List All Resources",
+    "7. Exit",
+    _SEP
+])
+
+
+def _open_input():
+    """Open a block-buffered reader on stdin, falling back to sys.stdin"""
+    try:
+        return open(sys.stdin.fileno(), 'r', buffering=_INPUT_BUFFER_SIZE,
+                    encoding='utf-8', closefd=False)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return sys.stdin
 
 
 class CloudConnectCLI:
@@ -12,28 +50,42 @@ class CloudConnectCLI:
     
     def __init__(self):
         self.manager = CloudConnectManager()
-        self.logger = ResourceLogger()
+        self.logger = self.manager.logger
+        self._in = _open_input()
+        self._creators = {
+            "AppService": self._create_app_service,
+            "StorageAccount": self._create_storage_account,
+            "CacheDB": self._create_cache_db
+        }
+        self._actions = {
+            1: self.create_resource,
+            2: self.start_resource,
+            3: self.stop_resource,
+            4: self.delete_resource,
+            5: self.view_logs,
+            6: self.list_resources
+        }
     
     def display_menu(self):
         """Display the main menu"""
-        print("\n" + "="*50)
-        print("CloudConnect - Cloud Resource Manager")
-        print("="*50)
-        print("1. Create Resource")
-        print("2. Start Resource")
-        print("3. Stop Resource")
-        print("4. Delete Resource")
-        print("5. View Logs")
-        print("6. List All Resources")
-        print("7. Exit")
-        print("="*50)
+        print(_MENU)
+    
+    def read_line(self, prompt):
+        """Prompt the user and read one line of input"""
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = self._in.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\n")
     
     def get_choice(self, prompt, options):
         """Get a validated choice from user"""
+        options_range = range(1, len(options) + 1)
         while True:
             try:
-                choice = int(input(prompt))
-                if 1 <= choice <= len(options):
+                choice = int(self.read_line(prompt))
+                if choice in options_range:
                     return choice
                 print(f"Please enter a number between 1 and {len(options)}")
             except ValueError:
@@ -41,7 +93,7 @@ class CloudConnectCLI:
     
     def generate_access_key(self):
         """Generate a random access key"""
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=32))
+        return secrets.token_urlsafe(_ACCESS_KEY_BYTES)
     
     def create_resource(self):
         """Handle resource creation"""
@@ -53,43 +105,34 @@ class CloudConnectCLI:
         choice = self.get_choice("Choice: ", types)
         resource_type = types[choice - 1]
         
-        name = input("Enter resource name: ").strip()
+        name = self.read_line("Enter resource name: ").strip()
         if not name:
             print("Resource name cannot be empty!")
             return
         
-        if resource_type == "AppService":
-            self._create_app_service(name)
-        elif resource_type == "StorageAccount":
-            self._create_storage_account(name)
-        elif resource_type == "CacheDB":
-            self._create_cache_db(name)
+        creator = self._creators.get(resource_type)
+        if creator:
+            creator(name)
     
     def _create_app_service(self, name):
         """Create an AppService resource"""
         print("\nSelect runtime:")
-        runtimes = ["python", "nodejs", "dotnet"]
-        for i, rt in enumerate(runtimes, 1):
+        for i, rt in enumerate(_RUNTIMES, 1):
             print(f"{i}. {rt}")
-        runtime = runtimes[self.get_choice("Choice: ", runtimes) - 1]
+        runtime = _RUNTIMES[self.get_choice("Choice: ", _RUNTIMES) - 1]
         
         print("\nSelect region:")
-        regions = ["EastUS", "WestEurope", "CentralIndia"]
-        for i, reg in enumerate(regions, 1):
+        for i, reg in enumerate(_REGIONS, 1):
             print(f"{i}. {reg}")
-        region = regions[self.get_choice("Choice: ", regions) - 1]
+        region = _REGIONS[self.get_choice("Choice: ", _REGIONS) - 1]
         
         print("\nSelect replica count:")
-        replicas = [1, 2, 3]
-        for i, rep in enumerate(replicas, 1):
+        for i, rep in enumerate(_REPLICAS, 1):
             print(f"{i}. {rep}")
-        replica_count = replicas[self.get_choice("Choice: ", replicas) - 1]
+        replica_count = _REPLICAS[self.get_choice("Choice: ", _REPLICAS) - 1]
         
-        success, message = self.manager.create_resource(
-            "AppService", name, 
-            runtime=runtime, 
-            region=region, 
-            replica_count=replica_count
+        success, message = self.manager.create_resource_positional(
+            "AppService", name, (runtime, region, replica_count)
         )
         print(f"\n{message}")
     
@@ -105,92 +148,81 @@ class CloudConnectCLI:
         print(f"\nGenerated access key: {access_key}")
         
         print("\nSelect maximum storage size:")
-        sizes = [50, 100, 500, 1000]
-        for i, size in enumerate(sizes, 1):
+        for i, size in enumerate(_SIZES, 1):
             print(f"{i}. {size}GB")
-        max_size_gb = sizes[self.get_choice("Choice: ", sizes) - 1]
+        max_size_gb = _SIZES[self.get_choice("Choice: ", _SIZES) - 1]
         
-        success, message = self.manager.create_resource(
-            "StorageAccount", name,
-            encryption_enabled=encryption_enabled,
-            access_key=access_key,
-            max_size_gb=max_size_gb
+        success, message = self.manager.create_resource_positional(
+            "StorageAccount", name, (encryption_enabled, access_key, max_size_gb)
         )
         print(f"\n{message}")
     
     def _create_cache_db(self, name):
         """Create a CacheDB resource"""
         print("\nSelect TTL (Time To Live):")
-        ttls = [60, 300, 600, 3600]
-        ttl_labels = ["60s (1 min)", "300s (5 min)", "600s (10 min)", "3600s (1 hour)"]
-        for i, label in enumerate(ttl_labels, 1):
+        for i, label in enumerate(_TTL_LABELS, 1):
             print(f"{i}. {label}")
-        ttl_seconds = ttls[self.get_choice("Choice: ", ttl_labels) - 1]
+        ttl_seconds = _TTLS[self.get_choice("Choice: ", _TTL_LABELS) - 1]
         
         print("\nSelect capacity:")
-        capacities = [128, 256, 512, 1024]
-        for i, cap in enumerate(capacities, 1):
+        for i, cap in enumerate(_CAPACITIES, 1):
             print(f"{i}. {cap}MB")
-        capacity_mb = capacities[self.get_choice("Choice: ", capacities) - 1]
+        capacity_mb = _CAPACITIES[self.get_choice("Choice: ", _CAPACITIES) - 1]
         
         print("\nSelect eviction policy:")
-        policies = ["LRU", "FIFO", "LFU", "RANDOM"]
-        for i, policy in enumerate(policies, 1):
+        for i, policy in enumerate(_POLICIES, 1):
             print(f"{i}. {policy}")
-        eviction_policy = policies[self.get_choice("Choice: ", policies) - 1]
+        eviction_policy = _POLICIES[self.get_choice("Choice: ", _POLICIES) - 1]
         
-        success, message = self.manager.create_resource(
-            "CacheDB", name,
-            ttl_seconds=ttl_seconds,
-            capacity_mb=capacity_mb,
-            eviction_policy=eviction_policy
+        success, message = self.manager.create_resource_positional(
+            "CacheDB", name, (ttl_seconds, capacity_mb, eviction_policy)
         )
         print(f"\n{message}")
     
     def start_resource(self):
         """Handle resource start"""
-        name = input("\nEnter resource name: ").strip()
+        name = self.read_line("\nEnter resource name: ").strip()
         success, message = self.manager.start_resource(name)
         print(f"\n{message}")
     
     def stop_resource(self):
         """Handle resource stop"""
-        name = input("\nEnter resource name: ").strip()
+        name = self.read_line("\nEnter resource name: ").strip()
         success, message = self.manager.stop_resource(name)
         print(f"\n{message}")
     
     def delete_resource(self):
         """Handle resource deletion"""
-        name = input("\nEnter resource name: ").strip()
+        name = self.read_line("\nEnter resource name: ").strip()
         success, message = self.manager.delete_resource(name)
         print(f"\n{message}")
     
     def view_logs(self):
         """Display recent logs"""
-        print("\n" + "="*50)
+        print("\n" + _SEP)
         print("Recent Activity Logs")
-        print("="*50)
+        print(_SEP)
         logs = self.logger.get_all_logs()
         if logs:
             for log in logs:
                 print(log.strip())
         else:
             print("No logs available yet.")
-        print("="*50)
+        print(_SEP)
     
     def list_resources(self):
         """List all resources"""
         resources = self.manager.list_resources()
-        print("\n" + "="*50)
+        print("\n" + _SEP)
         print(f"All Resources ({len(resources)})")
-        print("="*50)
+        print(_SEP)
         if resources:
             for resource in resources:
                 print(resource.get_display_info())
-                print("-" * 50)
+                print(_DIVIDER)
         else:
             print("No resources created yet.")
-        print("="*50)
+        print(_SEP)
     
     def run(self):
         """Main loop for CLI"""
@@ -199,28 +231,20 @@ class CloudConnectCLI:
         while True:
             self.display_menu()
             try:
-                choice = int(input("\nEnter choice: "))
+                choice = int(self.read_line("\nEnter choice: "))
                 
-                if choice == 1:
-                    self.create_resource()
-                elif choice == 2:
-                    self.start_resource()
-                elif choice == 3:
-                    self.stop_resource()
-                elif choice == 4:
-                    self.delete_resource()
-                elif choice == 5:
-                    self.view_logs()
-                elif choice == 6:
-                    self.list_resources()
-                elif choice == 7:
+                if choice == 7:
                     print("\nThank you for using CloudConnect!")
                     break
+                
+                action = self._actions.get(choice)
+                if action:
+                    action()
                 else:
                     print("\nInvalid choice. Please try again.")
             except ValueError:
                 print("\nInvalid input. Please enter a number.")
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 print("\n\nExiting CloudConnect...")
                 break
 
@@ -3,11 +3,21 @@ CloudConnect - Graphical User Interface using Tkinter
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import random
-import string
+import secrets
 from registry import CloudConnectManager, ResourceRegistry
 from base_resources import ResourceLogger
 
+# Configuration choices offered for each resource type
+_RUNTIMES = ("python", "nodejs", "dotnet")
+_REGIONS = ("EastUS", "WestEurope", "CentralIndia")
+_SIZES = (50, 100, 500, 1000)
+_TTLS = (60, 300, 600, 3600)
+_CAPACITIES = (128, 256, 512, 1024)
+_POLICIES = ("LRU", "FIFO", "LFU", "RANDOM")
+
+_REFRESH_DELAY_MS = 50  # Window in which view refresh requests are coalesced
+_ACCESS_KEY_BYTES = 24  # Encodes to exactly 32 URL-safe characters
+
 
 class CloudConnectGUI:
     """Graphical User Interface for CloudConnect"""
@@ -18,8 +28,11 @@ class CloudConnectGUI:
         self.root.geometry("900x700")
         self.root.configure(bg='#f0f0f0')
         
-        self.manager = CloudConnectManager()
-        self.logger = ResourceLogger()
+        self.manager = CloudConnectManager(logger=ResourceLogger(console=False))
+        self.logger = self.manager.logger
+        self._refresh_pending = False
+        self._tree_ids = {}    # Resource name -> Treeview row id
+        self._tree_state = {}  # Resource name -> (state, config) last rendered
         
         self.setup_ui()
     
@@ -234,7 +247,7 @@ class CloudConnectGUI:
                 runtime_combo = ttk.Combobox(
                     config_frame,
                     textvariable=runtime_var,
-                    values=["python", "nodejs", "dotnet"],
+                    values=_RUNTIMES,
                     state='readonly',
                     width=25
                 )
@@ -247,7 +260,7 @@ class CloudConnectGUI:
                 region_combo = ttk.Combobox(
                     config_frame,
                     textvariable=region_var,
-                    values=["EastUS", "WestEurope", "CentralIndia"],
+                    values=_REGIONS,
                     state='readonly',
                     width=25
                 )
@@ -277,7 +290,7 @@ class CloudConnectGUI:
                 size_combo = ttk.Combobox(
                     config_frame,
                     textvariable=size_var,
-                    values=[50, 100, 500, 1000],
+                    values=_SIZES,
                     state='readonly',
                     width=25
                 )
@@ -286,7 +299,7 @@ class CloudConnectGUI:
                 config_widgets['max_size_gb'] = size_var
                 
                 # Auto-generate access key
-                access_key = ''.join(random.choices(string.ascii_letters + string.digits, k=32))
+                access_key = secrets.token_urlsafe(_ACCESS_KEY_BYTES)
                 tk.Label(config_frame, text="Access Key:", bg='#ecf0f1').grid(row=2, column=0, sticky='w', pady=5)
                 key_label = tk.Label(config_frame, text=access_key[:16] + "...", bg='#ecf0f1', font=('Courier', 9))
                 key_label.grid(row=2, column=1, sticky='w', pady=5)
@@ -298,7 +311,7 @@ class CloudConnectGUI:
                 ttl_combo = ttk.Combobox(
                     config_frame,
                     textvariable=ttl_var,
-                    values=[60, 300, 600, 3600],
+                    values=_TTLS,
                     state='readonly',
                     width=25
                 )
@@ -311,7 +324,7 @@ class CloudConnectGUI:
                 capacity_combo = ttk.Combobox(
                     config_frame,
                     textvariable=capacity_var,
-                    values=[128, 256, 512, 1024],
+                    values=_CAPACITIES,
                     state='readonly',
                     width=25
                 )
@@ -324,7 +337,7 @@ class CloudConnectGUI:
                 policy_combo = ttk.Combobox(
                     config_frame,
                     textvariable=policy_var,
-                    values=["LRU", "FIFO", "LFU", "RANDOM"],
+                    values=_POLICIES,
                     state='readonly',
                     width=25
                 )
@@ -364,8 +377,7 @@ class CloudConnectGUI:
             if success:
                 messagebox.showinfo("Success", message)
                 dialog.destroy()
-                self.refresh_resources()
-                self.refresh_logs()
+                self.schedule_refresh()
             else:
                 messagebox.showerror("Error", message)
         
@@ -418,8 +430,7 @@ class CloudConnectGUI:
         else:
             messagebox.showerror("Error", message)
         
-        self.refresh_resources()
-        self.refresh_logs()
+        self.schedule_refresh()
     
     def stop_resource(self):
         """Stop the selected resource"""
@@ -434,8 +445,7 @@ class CloudConnectGUI:
         else:
             messagebox.showerror("Error", message)
         
-        self.refresh_resources()
-        self.refresh_logs()
+        self.schedule_refresh()
     
     def delete_resource(self):
         """Delete the selected resource"""
@@ -453,25 +463,49 @@ class CloudConnectGUI:
         else:
             messagebox.showerror("Error", message)
         
+        self.schedule_refresh()
+    
+    def schedule_refresh(self):
+        """Schedule one refresh of the resource and log views"""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after(_REFRESH_DELAY_MS, self._do_refresh)
+    
+    def _do_refresh(self):
+        """Run a scheduled refresh"""
+        self._refresh_pending = False
         self.refresh_resources()
         self.refresh_logs()
     
     def refresh_resources(self):
-        """Refresh the resource list"""
-        # Clear existing items
-        for item in self.resource_tree.get_children():
-            self.resource_tree.delete(item)
-        
-        # Add resources
+        """Refresh the resource list, touching only rows that changed"""
         resources = self.manager.list_resources()
+        current = {resource.name for resource in resources}
+        
+        # Drop rows for resources that no longer exist
+        for name in [n for n in self._tree_ids if n not in current]:
+            self.resource_tree.delete(self._tree_ids.pop(name))
+            del self._tree_state[name]
+        
+        # Insert new rows and update rows whose state or config changed
         for resource in resources:
-            config_str = ", ".join([f"{k}: {v}" for k, v in list(resource.config.items())[:2]])
-            self.resource_tree.insert('', 'end', values=(
+            config_str = resource.get_config_summary()
+            row_state = (resource.state.value, config_str)
+            if self._tree_state.get(resource.name) == row_state:
+                continue
+            
+            values = (
                 resource.name,
                 resource.__class__.__name__,
                 resource.state.value,
                 config_str
-            ))
+            )
+            iid = self._tree_ids.get(resource.name)
+            if iid is None:
+                self._tree_ids[resource.name] = self.resource_tree.insert('', 'end', values=values)
+            else:
+                self.resource_tree.item(iid, values=values)
+            self._tree_state[resource.name] = row_state
     
     def refresh_logs(self):
         """Refresh the log display"""
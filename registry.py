@@ -1,58 +1,203 @@
 """
 CloudConnect - Resource Registry and Manager
 """
+from array import array
+import inspect
+import sys
+
+from base_resources import ResourceLogger, ResourceState
 from resources import AppService, StorageAccount, CacheDB
 
 
 class ResourceRegistry:
     """Registry for managing resource types - implements Factory pattern"""
     
-    _registry = {}
+    _registry = []     # Resource classes indexed by type id
+    _type_ids = {}     # Type name -> type id
+    _classes = {}      # Type name -> resource class, for single-lookup dispatch by name
+    _parameters = []   # (positional, required, accepted, takes_logger) by type id
+    _all_types = None  # Memoized result of get_all_types, reset on register
     
     @classmethod
     def register(cls, resource_class):
-        """Register a new resource type"""
-        cls._registry[resource_class.get_type_name()] = resource_class
+        """Register a new resource type and assign it an integer TYPE_ID"""
+        type_name = sys.intern(resource_class.get_type_name())
+        type_id = cls._type_ids.get(type_name)
+        parameters = cls._inspect_parameters(resource_class)
+        if type_id is None:
+            type_id = len(cls._registry)
+            cls._registry.append(resource_class)
+            cls._parameters.append(parameters)
+            cls._type_ids[type_name] = type_id
+        else:
+            cls._registry[type_id] = resource_class
+            cls._parameters[type_id] = parameters
+        cls._classes[type_name] = resource_class
+        
+        resource_class.TYPE_ID = type_id
+        resource_class._OK_CREATED = (True, f"{type_name} created successfully!")
+        cls._all_types = None
         return resource_class
     
+    @staticmethod
+    def _inspect_parameters(resource_class):
+        """Describe a class's constructor as (positional, required, accepted, takes_logger)
+        
+        positional lists the config names that can be passed positionally, in
+        order; accepted is None when the constructor takes **kwargs; takes_logger
+        tells whether it has a logger parameter to receive the manager's logger.
+        """
+        positional = []
+        required = []
+        accepted = set()
+        takes_kwargs = False
+        takes_logger = False
+        params = list(inspect.signature(resource_class.__init__).parameters.values())
+        for param in params[2:]:  # Skip self and name
+            if param.kind == param.VAR_KEYWORD:
+                takes_kwargs = True
+            elif param.name == 'logger':
+                takes_logger = True
+            elif param.kind != param.VAR_POSITIONAL:
+                if param.kind != param.KEYWORD_ONLY:
+                    positional.append(param.name)
+                accepted.add(param.name)
+                if param.default is param.empty:
+                    required.append(param.name)
+        return (tuple(positional), tuple(required),
+                None if takes_kwargs else frozenset(accepted), takes_logger)
+    
+    @classmethod
+    def get_parameters(cls, resource_class):
+        """Get the inspected constructor parameters of a registered class"""
+        return cls._parameters[resource_class.TYPE_ID]
+    
+    @classmethod
+    def get_type_id(cls, type_name):
+        """Get the integer id of a registered type name"""
+        return cls._type_ids.get(type_name)
+    
     @classmethod
-    def get_resource_class(cls, type_name):
-        """Get a resource class by its type name"""
-        return cls._registry.get(type_name)
+    def get_resource_class(cls, type_ref):
+        """Get a resource class by its type name or type id"""
+        if not isinstance(type_ref, int):
+            return cls._classes.get(type_ref)
+        if 0 <= type_ref < len(cls._registry):
+            return cls._registry[type_ref]
+        return None
     
     @classmethod
     def get_all_types(cls):
         """Get all registered resource types"""
-        return list(cls._registry.keys())
+        if cls._all_types is None:
+            cls._all_types = tuple(cls._type_ids)
+        return cls._all_types
 
 
 # Auto-register all resource types
 ResourceRegistry.register(AppService)
 ResourceRegistry.register(StorageAccount)
 ResourceRegistry.register(CacheDB)
+ResourceRegistry.get_all_types()  # Prewarm the type-name tuple the interfaces list at startup
+
+
+_NO_KWARGS = {}  # Shared empty mapping for positional creation; never mutated
+
+_ERR_NOT_FOUND = "Resource '%s' not found"
+
+# Compact integer codes for lifecycle states, used by the manager's state column
+_STATE_CODES = {state: code for code, state in enumerate(ResourceState)}
 
 
 class CloudConnectManager:
-    """Main manager for CloudConnect resources"""
+    """Main manager for CloudConnect resources
     
-    def __init__(self):
+    Besides the name -> resource mapping, the manager keeps one row per
+    resource in parallel columns (names, type ids, state codes) so bulk
+    queries such as count_by_state run over flat arrays. Each resource
+    reports its state changes back to the manager, so the state column also
+    stays current when a resource is started or stopped directly.
+    """
+    
+    def __init__(self, logger=None):
         self.resources = {}
+        self.logger = logger or ResourceLogger()
+        self._rows = {}              # Resource name -> row index
+        self._names = []
+        self._type_ids = array('H')
+        self._states = array('B')
+        self._names_cache = None     # Tuple views, rebuilt after a resource is added
+        self._values_cache = None
+        self._state_listener = self._sync_state  # One bound method shared by all resources
     
     def create_resource(self, resource_type, name, **kwargs):
-        """Create a new resource"""
+        """Create a new resource from a registered type name or type id"""
+        resource_class = ResourceRegistry.get_resource_class(resource_type)
+        return self._create(resource_class, resource_type, name, kwargs=kwargs)
+    
+    def create_resource_positional(self, resource_type, name, args):
+        """Create a new resource, passing its configuration values in constructor order
+        
+        The order for a type is ResourceRegistry.get_parameters(cls)[0]; this
+        skips building a kwargs dict for callers that already know it.
+        """
+        resource_class = ResourceRegistry.get_resource_class(resource_type)
+        return self._create(resource_class, resource_type, name, args=args)
+    
+    def create_resources(self, specs):
+        """Create resources from (resource_type, name, kwargs) specs
+        
+        Each distinct resource type is resolved once for the whole batch.
+        specs may be any iterable, including a generator.
+        Returns one (success, message) result per spec, in order.
+        """
+        classes = {}
+        results = []
+        for resource_type, name, kwargs in specs:
+            if resource_type not in classes:
+                classes[resource_type] = ResourceRegistry.get_resource_class(resource_type)
+            results.append(self._create(classes[resource_type], resource_type, name, kwargs=kwargs))
+        return results
+    
+    def _create(self, resource_class, resource_type, name, args=(), kwargs=_NO_KWARGS):
+        """Create and index one resource of an already-resolved class"""
+        # One canonical key object shared by the dict, the row index and the resource
+        if type(name) is str:
+            name = sys.intern(name)
         if name in self.resources:
             return False, f"Resource '{name}' already exists"
         
-        resource_class = ResourceRegistry.get_resource_class(resource_type)
         if not resource_class:
             return False, f"Unknown resource type: {resource_type}"
         
-        try:
-            resource = resource_class(name, **kwargs)
-            self.resources[name] = resource
-            return True, f"{resource_type} created successfully!"
-        except Exception as e:
-            return False, f"Error creating resource: {str(e)}"
+        positional, required, accepted, takes_logger = ResourceRegistry.get_parameters(resource_class)
+        error = self._check_config(positional, required, accepted, args, kwargs)
+        if error:
+            return False, f"Error creating resource: {error}"
+        
+        if takes_logger:
+            resource = resource_class(name, *args, logger=self.logger, **kwargs)
+        else:
+            resource = resource_class(name, *args, **kwargs)
+        self.resources[name] = resource
+        self._add_row(name, resource)
+        self._names_cache = None
+        self._values_cache = None
+        return resource_class._OK_CREATED
+    
+    @staticmethod
+    def _check_config(positional, required, accepted, args, kwargs):
+        """Return why args/kwargs don't fit a constructor's parameters, or None if they do"""
+        if len(args) > len(positional):
+            return f"expected at most {len(positional)} configuration values, got {len(args)}"
+        
+        supplied = positional[:len(args)]
+        missing = [param for param in required if param not in kwargs and param not in supplied]
+        if missing:
+            return f"missing {', '.join(missing)}"
+        if accepted is not None and not accepted.issuperset(kwargs):
+            return f"unexpected {', '.join(sorted(set(kwargs) - accepted))}"
+        return None
     
     def get_resource(self, name):
         """Get a resource by name"""
@@ -60,32 +205,59 @@ class CloudConnectManager:
     
     def start_resource(self, name):
         """Start a resource"""
-        resource = self.get_resource(name)
-        if not resource:
-            return False, f"Resource '{name}' not found"
+        resource = self.resources.get(name)
+        if resource is None:
+            return False, _ERR_NOT_FOUND % (name,)
         
         return resource.start()
     
     def stop_resource(self, name):
         """Stop a resource"""
-        resource = self.get_resource(name)
-        if not resource:
-            return False, f"Resource '{name}' not found"
+        resource = self.resources.get(name)
+        if resource is None:
+            return False, _ERR_NOT_FOUND % (name,)
         
         return resource.stop()
     
     def delete_resource(self, name):
         """Delete a resource"""
-        resource = self.get_resource(name)
-        if not resource:
-            return False, f"Resource '{name}' not found"
+        resource = self.resources.get(name)
+        if resource is None:
+            return False, _ERR_NOT_FOUND % (name,)
         
         return resource.delete()
     
     def list_resources(self):
-        """List all resources"""
-        return list(self.resources.values())
+        """List all resources as a read-only tuple"""
+        if self._values_cache is None:
+            self._values_cache = tuple(self.resources.values())
+        return self._values_cache
     
     def get_resource_names(self):
-        """Get list of all resource names"""
-        return list(self.resources.keys())
\ No newline at end of file
+        """Get all resource names as a read-only tuple"""
+        if self._names_cache is None:
+            self._names_cache = tuple(self._names)
+        return self._names_cache
+    
+    def count_by_state(self, state):
+        """Count resources currently in the given ResourceState"""
+        return self._states.count(_STATE_CODES[state])
+    
+    def count_by_type(self, resource_type):
+        """Count resources of a registered type name or type id"""
+        resource_class = ResourceRegistry.get_resource_class(resource_type)
+        if not resource_class:
+            return 0
+        return self._type_ids.count(resource_class.TYPE_ID)
+    
+    def _add_row(self, name, resource):
+        """Append a column row for a newly created resource"""
+        self._rows[name] = len(self._names)
+        self._names.append(name)
+        self._type_ids.append(resource.TYPE_ID)
+        self._states.append(_STATE_CODES[resource.state])
+        resource._state_listener = self._state_listener
+    
+    def _sync_state(self, resource):
+        """Copy a resource's current state into the state column"""
+        self._states[self._rows[resource.name]] = _STATE_CODES[resource.state]
\ No newline at end of file
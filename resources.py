@@ -1,33 +1,79 @@
 """
 CloudConnect - Concrete Resource Implementations
 """
+from typing import NamedTuple
+
 from base_resources import Resource
 
 
+class AppServiceConfig(NamedTuple):
+    """Configuration of an AppService"""
+    runtime: str
+    region: str
+    replica_count: int
+
+
+class StorageAccountConfig(NamedTuple):
+    """Configuration of a StorageAccount"""
+    encryption_enabled: bool
+    access_key: str
+    max_size_gb: int
+
+
+class CacheDBConfig(NamedTuple):
+    """Configuration of a CacheDB"""
+    ttl_seconds: int
+    capacity_mb: int
+    eviction_policy: str
+
+
+# Canonical config instances keyed by (config type, values, value types), so
+# values that merely compare equal (1 and True, 60 and 60.0) are never shared.
+# NamedTuples can't be weakly referenced and callers may pass arbitrary values,
+# so the cache is capped; configs beyond the cap are simply left unshared.
+_SHARED_CONFIGS = {}
+_SHARED_CONFIGS_LIMIT = 1024
+
+
+def _shared_config(config):
+    """Return the shared instance identical in values to config, or config itself"""
+    key = (type(config), config, tuple(map(type, config)))
+    try:
+        shared = _SHARED_CONFIGS.get(key)
+    except TypeError:  # Unhashable value, can't be shared
+        return config
+    if shared is None:
+        if len(_SHARED_CONFIGS) >= _SHARED_CONFIGS_LIMIT:
+            return config
+        _SHARED_CONFIGS[key] = shared = config
+    return shared
+
+
 class AppService(Resource):
     """Web application hosting service"""
     
-    def __init__(self, name, runtime, region, replica_count):
-        config = {
-            'runtime': runtime,
-            'region': region,
-            'replica_count': replica_count
-        }
-        super().__init__(name, config)
+    __slots__ = ()
+    
+    _DISPLAY_TEMPLATE = ("AppService: %s\n"
+                         "  Runtime: %s\n"
+                         "  Region: %s\n"
+                         "  Replicas: %s\n"
+                         "  State: ")
+    
+    def __init__(self, name, runtime, region, replica_count, logger=None):
+        config = _shared_config(AppServiceConfig(runtime, region, replica_count))
+        super().__init__(name, config, logger)
+        self._display_prefix = self._DISPLAY_TEMPLATE % (name, runtime, region, replica_count)
     
     def _format_creation_details(self):
-        return (f"with {self.config['runtime']} runtime, "
-                f"{self.config['replica_count']} replicas in {self.config['region']}")
+        return (f"with {self.config.runtime} runtime, "
+                f"{self.config.replica_count} replicas in {self.config.region}")
     
     def _format_start_details(self):
-        return f"in {self.config['region']}"
+        return f"in {self.config.region}"
     
     def get_display_info(self):
-        return (f"AppService: {self.name}\n"
-                f"  Runtime: {self.config['runtime']}\n"
-                f"  Region: {self.config['region']}\n"
-                f"  Replicas: {self.config['replica_count']}\n"
-                f"  State: {self.state.value}")
+        return self._display_prefix + self._state_str
     
     @classmethod
     def get_type_name(cls):
@@ -37,27 +83,32 @@ class AppService(Resource):
 class StorageAccount(Resource):
     """Cloud storage service"""
     
-    def __init__(self, name, encryption_enabled, access_key, max_size_gb):
-        config = {
-            'encryption_enabled': encryption_enabled,
-            'access_key': access_key,
-            'max_size_gb': max_size_gb
-        }
-        super().__init__(name, config)
+    __slots__ = ()
+    
+    # Indexed by the encryption flag
+    _ENCRYPTION_DETAILS = ("without encryption", "with encryption")
+    _ENCRYPTION_LABELS = ("Disabled", "Enabled")
+    
+    _DISPLAY_TEMPLATE = ("StorageAccount: %s\n"
+                         "  Encryption: %s\n"
+                         "  Access Key: %.12s...\n"
+                         "  Max Size: %sGB\n"
+                         "  State: ")
+    
+    def __init__(self, name, encryption_enabled, access_key, max_size_gb, logger=None):
+        super().__init__(name, StorageAccountConfig(encryption_enabled, access_key, max_size_gb), logger)
+        self._display_prefix = self._DISPLAY_TEMPLATE % (
+            name, self._ENCRYPTION_LABELS[bool(encryption_enabled)], access_key, max_size_gb)
     
     def _format_creation_details(self):
-        encryption = "with encryption" if self.config['encryption_enabled'] else "without encryption"
-        return f"{encryption}, max size {self.config['max_size_gb']}GB"
+        encryption = self._ENCRYPTION_DETAILS[bool(self.config.encryption_enabled)]
+        return f"{encryption}, max size {self.config.max_size_gb}GB"
     
     def _format_start_details(self):
-        return f"with access key {self.config['access_key'][:8]}..."
+        return f"with access key {self.config.access_key[:8]}..."
     
     def get_display_info(self):
-        return (f"StorageAccount: {self.name}\n"
-                f"  Encryption: {'Enabled' if self.config['encryption_enabled'] else 'Disabled'}\n"
-                f"  Access Key: {self.config['access_key'][:12]}...\n"
-                f"  Max Size: {self.config['max_size_gb']}GB\n"
-                f"  State: {self.state.value}")
+        return self._display_prefix + self._state_str
     
     @classmethod
     def get_type_name(cls):
@@ -67,29 +118,30 @@ class StorageAccount(Resource):
 class CacheDB(Resource):
     """In-memory caching database service"""
     
-    def __init__(self, name, ttl_seconds, capacity_mb, eviction_policy):
-        config = {
-            'ttl_seconds': ttl_seconds,
-            'capacity_mb': capacity_mb,
-            'eviction_policy': eviction_policy
-        }
-        super().__init__(name, config)
+    __slots__ = ()
+    
+    _DISPLAY_TEMPLATE = ("CacheDB: %s\n"
+                         "  TTL: %s seconds\n"
+                         "  Capacity: %sMB\n"
+                         "  Eviction Policy: %s\n"
+                         "  State: ")
+    
+    def __init__(self, name, ttl_seconds, capacity_mb, eviction_policy, logger=None):
+        config = _shared_config(CacheDBConfig(ttl_seconds, capacity_mb, eviction_policy))
+        super().__init__(name, config, logger)
+        self._display_prefix = self._DISPLAY_TEMPLATE % (name, ttl_seconds, capacity_mb, eviction_policy)
     
     def _format_creation_details(self):
-        return (f"with {self.config['eviction_policy']} eviction, "
-                f"{self.config['capacity_mb']}MB capacity, "
-                f"TTL {self.config['ttl_seconds']}s")
+        return (f"with {self.config.eviction_policy} eviction, "
+                f"{self.config.capacity_mb}MB capacity, "
+                f"TTL {self.config.ttl_seconds}s")
     
     def _format_start_details(self):
-        return f"with {self.config['eviction_policy']} policy"
+        return f"with {self.config.eviction_policy} policy"
     
     def get_display_info(self):
-        return (f"CacheDB: {self.name}\n"
-                f"  TTL: {self.config['ttl_seconds']} seconds\n"
-                f"  Capacity: {self.config['capacity_mb']}MB\n"
-                f"  Eviction Policy: {self.config['eviction_policy']}\n"
-                f"  State: {self.state.value}")
+        return self._display_prefix + self._state_str
     
     @classmethod
     def get_type_name(cls):
-        return "CacheDB"
\ No newline at end of file
+        return "CacheDB"